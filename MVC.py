@@ -1,21 +1,37 @@
 import os
+import functools
 import hmac
-import hashlib
 import base64
-import uuid
+import secrets
 import time
 import urllib.parse
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import queue
 import platform
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# orjson parses the large report-list payloads several times faster than
+# stdlib json; fall back silently when it isn't installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Constants
 TOKEN_URL = "https://portalapi.lcegateway.com/Token"
 REPORT_URL_BASE = "https://portalapi.lcegateway.com/GetReportBlobs"
+# Percent-encoded + lowercased base URL, precomputed once so HMAC signing
+# only has to encode the (short) query string portion of each request URL
+_ENCODED_URL_PREFIX = urllib.parse.quote(REPORT_URL_BASE, safe="").lower()
 TODAY = datetime.now().strftime("%Y-%m-%d")
 BASE_DIR = Path.home() / "Downloads" / "LC Reports" / TODAY
 BASE_DIR.mkdir(parents=True, exist_ok=True)
@@ -35,7 +51,11 @@ def setup_debug_logger():
     
     # Check if running as EXE (PyInstaller sets this)
     is_exe = getattr(sys, 'frozen', False) or hasattr(sys, '_MEIPASS')
-    
+
+    # Real handlers run on a background QueueListener thread so log records
+    # never do disk/console I/O on the calling thread
+    handlers = []
+
     # File handler - always create this
     try:
         # Ensure directory exists
@@ -44,24 +64,34 @@ def setup_debug_logger():
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         # If we can't create log file, at least try console
         print(f"Warning: Could not create log file {DEBUG_LOG_FILE}: {e}")
-    
+
     # Console handler - only add if not EXE or if console is available
     # In EXE mode with console=False, stdout might not be available
     if not is_exe:
         try:
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG)
+            # Keep per-file chatter out of the console; the log file still
+            # captures everything at DEBUG
+            console_handler.setLevel(logging.INFO)
             console_formatter = logging.Formatter('%(levelname)s - %(message)s')
             console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         except Exception:
             # Silently fail if console isn't available
             pass
-    
+
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        # Flush queued records before interpreter shutdown
+        atexit.register(listener.stop)
+
     # Log system information at startup
     logger.info("=" * 80)
     logger.info("LC REPORT DOWNLOADER - DEBUG SESSION STARTED")
@@ -83,64 +113,129 @@ def setup_debug_logger():
 # Initialize logger
 debug_logger = setup_debug_logger()
 
+# Shared HTTP session so every call reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request
+_SESSION = requests.Session()
+# pool_maxsize must comfortably exceed the download worker count, otherwise
+# urllib3 discards the extra sockets and the workers re-handshake every time
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=64,
+    pool_block=False,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"])
+    )
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+def get_session():
+    """Return the shared requests.Session used for all API and blob calls"""
+    return _SESSION
+
+@functools.lru_cache(maxsize=4)
+def _decode_hmac_key(hmac_key_b64):
+    """Cache the base64 decode of the HMAC key; keyed on the key string so
+    credential changes from the GUI are still picked up"""
+    return base64.b64decode(hmac_key_b64)
+
 def generate_hmac_header(http_method, request_url):
     HMAC_USER = os.getenv("HMAC_USER")
     HMAC_KEY = os.getenv("HMAC_KEY")
-    
-    debug_logger.debug("=" * 80)
-    debug_logger.debug("HMAC HEADER GENERATION")
-    debug_logger.debug("=" * 80)
-    debug_logger.debug(f"HTTP Method: {http_method}")
-    debug_logger.debug(f"Original Request URL: {request_url}")
-    debug_logger.debug(f"HMAC User: {HMAC_USER}")
-    debug_logger.debug(f"HMAC Key Length: {len(HMAC_KEY) if HMAC_KEY else 0} characters")
-    
+
+    # Skip all the f-string formatting below when DEBUG logging is off -
+    # this function runs once per download, so it adds up
+    verbose = debug_logger.isEnabledFor(logging.DEBUG)
+    if verbose:
+        debug_logger.debug("=" * 80)
+        debug_logger.debug("HMAC HEADER GENERATION")
+        debug_logger.debug("=" * 80)
+        debug_logger.debug(f"HTTP Method: {http_method}")
+        debug_logger.debug(f"Original Request URL: {request_url}")
+        debug_logger.debug(f"HMAC User: {HMAC_USER}")
+        debug_logger.debug(f"HMAC Key Length: {len(HMAC_KEY) if HMAC_KEY else 0} characters")
+
     if not HMAC_USER or not HMAC_KEY:
         debug_logger.error("Missing HMAC credentials!")
         raise ValueError("HMAC_USER and HMAC_KEY environment variables must be set")
-    
-    nonce = uuid.uuid4().hex
+
+    # 32 random hex chars, without the UUID object construction uuid4().hex paid
+    nonce = secrets.token_hex(16)
     timestamp = str(int(time.time()))
-    debug_logger.debug(f"Nonce: {nonce}")
-    debug_logger.debug(f"Timestamp: {timestamp} (Unix time: {int(time.time())})")
-    
+    if verbose:
+        debug_logger.debug(f"Nonce: {nonce}")
+        debug_logger.debug(f"Timestamp: {timestamp} (Unix time: {int(time.time())})")
+
     # Use the EXACT original approach that worked in v1.0.2
     # Encode the entire URL, then lowercase it (this is what v1.0.2 was doing)
-    encoded_url = urllib.parse.quote(request_url, safe="").lower()
-    debug_logger.debug(f"Encoded URL (original method - encode then lowercase): {encoded_url}")
-    
-    debug_logger.debug(f"Final Encoded URL (for HMAC): {encoded_url}")
-    
-    raw_string = HMAC_USER + http_method + encoded_url + timestamp + nonce
-    debug_logger.debug(f"Raw String (before hashing): {HMAC_USER} + {http_method} + {encoded_url} + {timestamp} + {nonce}")
-    debug_logger.debug(f"Raw String Length: {len(raw_string)} characters")
-    
-    raw_bytes = raw_string.encode("utf-8")
-    key_bytes = base64.b64decode(HMAC_KEY)
-    signature = base64.b64encode(hmac.new(key_bytes, raw_bytes, hashlib.sha256).digest()).decode()
-    
+    # Report URLs share a fixed base, so reuse its precomputed encoding and
+    # only quote the query string
+    if request_url.startswith(REPORT_URL_BASE):
+        suffix = request_url[len(REPORT_URL_BASE):]
+        encoded_url = _ENCODED_URL_PREFIX + urllib.parse.quote(suffix, safe="").lower()
+    else:
+        encoded_url = urllib.parse.quote(request_url, safe="").lower()
+    if verbose:
+        debug_logger.debug(f"Encoded URL (original method - encode then lowercase): {encoded_url}")
+        debug_logger.debug(f"Final Encoded URL (for HMAC): {encoded_url}")
+
+    # Build the signed bytes with one C-level join; identical to
+    # concatenating the str pieces and encoding the result
+    raw_bytes = b"".join((
+        HMAC_USER.encode("utf-8"),
+        http_method.encode("utf-8"),
+        encoded_url.encode("utf-8"),
+        timestamp.encode("utf-8"),
+        nonce.encode("utf-8"),
+    ))
+    if verbose:
+        debug_logger.debug(f"Raw String (before hashing): {HMAC_USER} + {http_method} + {encoded_url} + {timestamp} + {nonce}")
+        debug_logger.debug(f"Raw String Length: {len(raw_bytes)} characters")
+    key_bytes = _decode_hmac_key(HMAC_KEY)
+    # hmac.digest is a one-shot C path straight into OpenSSL, skipping the
+    # incremental HMAC object hmac.new builds
+    signature = base64.b64encode(hmac.digest(key_bytes, raw_bytes, "sha256")).decode()
+
     hmac_header = f"amx {HMAC_USER}:{signature}:{nonce}:{timestamp}"
-    debug_logger.debug(f"Generated HMAC Header: {hmac_header}")
-    debug_logger.debug("=" * 80)
-    
+    if verbose:
+        debug_logger.debug(f"Generated HMAC Header: {hmac_header}")
+        debug_logger.debug("=" * 80)
+
     return hmac_header
 
+# Cached bearer token so repeated calls (one per GUI click/download) don't
+# redo the /Token round trip until the token is close to expiring
+_token_cache = {"token": None, "expiry": 0.0, "username": None}
+
 def get_token():
     debug_logger.debug("=" * 80)
     debug_logger.debug("TOKEN REQUEST")
     debug_logger.debug("=" * 80)
-    
+
     GATEWAY_USERNAME = os.getenv("GATEWAY_USERNAME")
     GATEWAY_PASSWORD = os.getenv("GATEWAY_PASSWORD")
-    
+
     debug_logger.debug(f"Username: {GATEWAY_USERNAME}")
     debug_logger.debug(f"Password Length: {len(GATEWAY_PASSWORD) if GATEWAY_PASSWORD else 0} characters")
     debug_logger.debug(f"Token URL: {TOKEN_URL}")
-    
+
     if not GATEWAY_USERNAME or not GATEWAY_PASSWORD:
         debug_logger.error("Missing gateway credentials!")
         raise ValueError("GATEWAY_USERNAME and GATEWAY_PASSWORD environment variables must be set")
-    
+
+    # Reuse the cached token unless it expires within the next minute or
+    # the GUI switched to a different account; monotonic clock so NTP
+    # jumps or system sleep can't stretch a token past its real expiry
+    if (_token_cache["token"]
+            and _token_cache["username"] == GATEWAY_USERNAME
+            and time.monotonic() < _token_cache["expiry"] - 60):
+        debug_logger.debug("Reusing cached token")
+        debug_logger.debug("=" * 80)
+        return _token_cache["token"]
+
     payload = {
         "grant_type": "password",
         "username": GATEWAY_USERNAME,
@@ -149,7 +244,7 @@ def get_token():
     debug_logger.debug(f"Request Payload: grant_type=password, username={GATEWAY_USERNAME}")
     
     try:
-        response = requests.post(TOKEN_URL, data=payload)
+        response = _SESSION.post(TOKEN_URL, data=payload)
         debug_logger.debug(f"Response Status Code: {response.status_code}")
         debug_logger.debug(f"Response Headers: {dict(response.headers)}")
         
@@ -158,7 +253,13 @@ def get_token():
             raise ValueError(f"Authentication failed: Invalid username or password (Status: {response.status_code})")
         
         response.raise_for_status()
-        token = response.json()["access_token"]
+        token_response = response.json()
+        token = token_response["access_token"]
+        expires_in = float(token_response.get("expires_in", 0))
+        if expires_in:
+            _token_cache["token"] = token
+            _token_cache["expiry"] = time.monotonic() + expires_in
+            _token_cache["username"] = GATEWAY_USERNAME
         debug_logger.debug(f"Token obtained successfully (length: {len(token)} characters)")
         debug_logger.debug(f"Token (first 50 chars): {token[:50]}...")
         debug_logger.debug("=" * 80)
@@ -167,75 +268,145 @@ def get_token():
         debug_logger.error(f"Token request exception: {str(e)}")
         raise
 
+# Cap on concurrent blob downloads so we don't hammer the server
+MAX_PARALLEL_DOWNLOADS = 8
+
+def _download_report_blob(report):
+    """Download a single report blob into BASE_DIR and return the saved path"""
+    name = report["ReportName"]
+    url = report["ReportBlobUri"]
+    filepath = BASE_DIR / name
+    # Stream to disk in large chunks, writing through the raw fd so each
+    # chunk skips the buffered-writer copy; when the size is known up front,
+    # preallocate so the filesystem can lay the file out in one extent
+    with _SESSION.get(url, stream=True, timeout=(5, 60)) as r:
+        r.raise_for_status()
+        total = int(r.headers.get("content-length", 0))
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if total and hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, total)
+            for chunk in r.iter_content(1 << 20):
+                os.write(fd, chunk)
+        finally:
+            os.close(fd)
+    return filepath
+
+# Short-lived cache of the history scan so rapid repeat runs don't re-walk
+# every daily folder
+_PREV_FILES_TTL = 60
+_prev_files_cache = {"key": None, "time": 0.0, "files": None}
+
 def get_previously_downloaded_files(base_dir, today_folder):
+    # os.scandir only reads directory entries (no per-file stat, no Path
+    # objects), which matters once months of daily folders pile up
+    cache_key = (os.fspath(base_dir), today_folder.name)
+    now = time.time()
+    if _prev_files_cache["key"] == cache_key and now - _prev_files_cache["time"] < _PREV_FILES_TTL:
+        return _prev_files_cache["files"]
+
     all_files = set()
-    for subfolder in base_dir.iterdir():
-        if subfolder.is_dir() and subfolder != today_folder:
-            for file in subfolder.glob("*"):
-                all_files.add(file.name)
+    today_name = today_folder.name
+    with os.scandir(base_dir) as it:
+        for sub in it:
+            if sub.is_dir(follow_symlinks=False) and sub.name != today_name:
+                with os.scandir(sub.path) as files:
+                    # Interned names let the membership checks in
+                    # download_reports compare pointers, not characters
+                    all_files.update(sys.intern(entry.name) for entry in files)
+
+    _prev_files_cache["key"] = cache_key
+    _prev_files_cache["time"] = now
+    _prev_files_cache["files"] = all_files
     return all_files
 
-def download_reports(token, username):
-    file_name = "all"
+def list_reports(username, file_name="all"):
+    """Authenticate and fetch the report list in one call.
+
+    Client-side aggregation of the token + GetReportBlobs sequence; the
+    token round trip is skipped entirely while the cached token is valid.
+    """
     full_url = f"{REPORT_URL_BASE}?userName={username}&fileName={file_name}"
 
+    # The HMAC scheme is nonced (fresh nonce + timestamp per header), so a
+    # signed header must never be cached and replayed; the next best thing
+    # is signing while the token round trip is in flight, since the two
+    # are independent
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        hmac_future = executor.submit(generate_hmac_header, "GET", full_url)
+        token = get_token()
+        hmac_header = hmac_future.result()
+
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-        "HMacAuthorizationHeader": generate_hmac_header("GET", full_url)
+        "HMacAuthorizationHeader": hmac_header
     }
 
-    print(f"Requesting report list from: {full_url}")
-    response = requests.get(full_url, headers=headers)
+    debug_logger.debug("Requesting report list from: %s", full_url)
+    response = _SESSION.get(full_url, headers=headers)
     response.raise_for_status()
 
-    try:
-        raw_json_string = response.json()
-        report_list = json.loads(raw_json_string)
-    except Exception as e:
-        print("Failed to double-parse JSON:", e)
-        print("Raw response text:", response.text[:500])
-        return
+    # response.content is already bytes - skip response.json()'s charset
+    # sniffing and parse directly. The API double-encodes today, so only
+    # parse again when the first pass yields a string; if the server ever
+    # fixes it, the second parse (and its cost) just disappears
+    parsed = json_loads(response.content)
+    report_list = json_loads(parsed) if isinstance(parsed, str) else parsed
 
     if not isinstance(report_list, list):
-        print("Expected a list but got:", type(report_list))
+        raise ValueError(f"Expected a list but got: {type(report_list)}")
+    return report_list
+
+def download_reports(username):
+    try:
+        report_list = list_reports(username)
+    except Exception as e:
+        debug_logger.error("Failed to fetch report list: %s", e)
         return
 
     previously_downloaded = get_previously_downloaded_files(BASE_DIR.parent, BASE_DIR)
 
-    print(f"Found {len(report_list)} reports.")
+    debug_logger.info("Found %d reports.", len(report_list))
     downloaded = 0
     skipped = 0
 
+    to_download = []
     for report in report_list:
         name = report.get("ReportName")
         url = report.get("ReportBlobUri")
         if not name or not url:
             continue
 
+        name = sys.intern(name)
         if name in previously_downloaded:
-            print(f"Skipping (already downloaded in past): {name}")
+            debug_logger.debug("Skipping (already downloaded in past): %s", name)
             skipped += 1
             continue
 
-        filepath = BASE_DIR / name
-        try:
-            print(f"Downloading: {name}")
-            r = requests.get(url)
-            r.raise_for_status()
-            with open(filepath, "wb") as f:
-                f.write(r.content)
-            print(f"Saved to: {filepath}")
-            downloaded += 1
-        except Exception as e:
-            print(f"Failed to download {name}: {e}")
-
-    print(f"\n✅ Done: {downloaded} downloaded, {skipped} skipped")
-    print(f"📁 Files saved to: {BASE_DIR}")
+        to_download.append(report)
+
+    # The blob downloads are independent of each other and purely I/O-bound,
+    # so run them concurrently against the pooled session
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+        futures = {
+            executor.submit(_download_report_blob, report): report["ReportName"]
+            for report in to_download
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                filepath = future.result()
+                debug_logger.debug("Saved to: %s", filepath)
+                downloaded += 1
+            except Exception as e:
+                debug_logger.error("Failed to download %s: %s", name, e)
+
+    debug_logger.info("✅ Done: %d downloaded, %d skipped", downloaded, skipped)
+    debug_logger.info("📁 Files saved to: %s", BASE_DIR)
 
 def main():
-    token = get_token()
-    download_reports(token, GATEWAY_USERNAME)  # pyright: ignore[reportUndefinedVariable]
+    download_reports(os.getenv("GATEWAY_USERNAME"))
 
 if __name__ == "__main__":
     main()